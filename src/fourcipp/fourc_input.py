@@ -25,20 +25,23 @@ from __future__ import annotations
 
 import copy
 import difflib
+import itertools
 import pathlib
-from collections.abc import Sequence
+import sys
+from collections.abc import Collection, Iterable, Sequence
 from typing import Any, Callable
 
 from loguru import logger
 
 from fourcipp import CONFIG
 from fourcipp.legacy_io import (
-    inline_legacy_sections,
+    inline_legacy_section,
     interpret_legacy_section,
 )
 from fourcipp.utils.converter import Converter
 from fourcipp.utils.dict_utils import (
     compare_nested_dicts_or_lists,
+    copy_nested_dicts_or_lists,
     sort_by_key_order,
 )
 from fourcipp.utils.not_set import NOT_SET, check_if_set
@@ -50,18 +53,81 @@ from fourcipp.utils.yaml_io import dump_yaml, load_yaml
 CONVERTER = Converter()
 
 
+def _did_you_mean(key: str, candidates: Iterable[str]) -> str:
+    """Suggest the closest candidate for a section name.
+
+    Args:
+        key: Section name which could not be found
+        candidates: Possible section names
+
+    Returns:
+        Suggestion sentence, empty if no candidate is similar enough
+    """
+    if matches := difflib.get_close_matches(key.upper(), candidates, n=1, cutoff=0.3):
+        return f" Did you mean '{matches[0]}'?"
+    return ""
+
+
 class UnknownSectionException(Exception):
-    """Unknown section exception."""
+    """Unknown section exception.
+
+    The fuzzy search for a similar section name is only done once the
+    message is requested, so catching the exception is cheap.
+    """
+
+    def __init__(
+        self,
+        message: str,
+        key: str | None = None,
+        candidates: Sequence[str] = (),
+        message_suffix: str = "",
+    ) -> None:
+        """Initialise exception.
+
+        Args:
+            message: Error message, the suggestion is appended to it
+            key: Section name which could not be found
+            candidates: Possible section names for the suggestion
+            message_suffix: Error message after the suggestion
+        """
+        super().__init__(message + message_suffix)
+        self.message = message
+        self.key = key
+        self.candidates = candidates
+        self.message_suffix = message_suffix
+        self._full_message: str | None = None
+
+    def __str__(self) -> str:
+        """Error message including the suggestion.
+
+        Returns:
+            str: Error message
+        """
+        if self._full_message is None:
+            did_you_mean = ""
+            if self.key is not None:
+                did_you_mean = _did_you_mean(self.key, self.candidates)
+            self._full_message = self.message + did_you_mean + self.message_suffix
+            self.args = (self._full_message,)
+        return self._full_message
+
+    def __repr__(self) -> str:
+        """Representation string including the suggestion.
+
+        Returns:
+            str: Representation string
+        """
+        return f"{type(self).__name__}({str(self)!r})"
 
 
-def is_section_known(section_name: str, known_section_names: list[str]) -> bool:
+def is_section_known(section_name: str, known_section_names: Collection[str]) -> bool:
     """Returns if section in known.
 
     Does not apply to legacy sections.
 
     Args:
         section_name: Name of the section to check
-        known_section_names: Names of known sections
+        known_section_names: Names of known sections, preferably as set for fast lookups
 
     Returns:
         True if section is known.
@@ -97,8 +163,8 @@ def sort_by_section_names(data: dict) -> dict:
     design_sections = [
         s for s in CONFIG.sections.typed_sections if s.startswith("DESIGN")
     ]
-    remaining_typed_sections = list(
-        set(CONFIG.sections.typed_sections) - set(design_sections) - set(["MATERIALS"])
+    remaining_typed_sections = (
+        CONFIG.sections.typed_sections_set - set(design_sections) - {"MATERIALS"}
     )
 
     typed_sections = (
@@ -107,6 +173,13 @@ def sort_by_section_names(data: dict) -> dict:
         + sorted(design_sections, key=str.lower)
     )
 
+    # Positions of the sections, to avoid searching the lists for every section
+    required_sections_positions = {s: i for i, s in enumerate(required_sections)}
+    typed_sections_positions = {s: i for i, s in enumerate(typed_sections)}
+    legacy_sections_positions = {
+        s: i for i, s in enumerate(CONFIG.sections.legacy_sections)
+    }
+
     # function sections (sorted numerically)
     functions = sorted(
         [s for s in data.keys() if s.startswith("FUNCT") and s[5:].isdigit()],
@@ -114,6 +187,7 @@ def sort_by_section_names(data: dict) -> dict:
             s.lower() if not s.startswith("FUNCT") else f"funct{s[5:].zfill(10)}"
         ),
     )
+    functions_positions = {s: i for i, s in enumerate(functions)}
 
     def ordering_score(section: str) -> int:
         """Get ordering score, small score comes first, larger comes later.
@@ -130,24 +204,22 @@ def sort_by_section_names(data: dict) -> dict:
         if section == CONFIG.fourc_metadata["metadata"]["description_section_name"]:
             return 0
         # Required sections
-        elif section in required_sections:
-            return 1 * n_sections_splitter + required_sections.index(section)
+        elif section in required_sections_positions:
+            return 1 * n_sections_splitter + required_sections_positions[section]
         # Typed sections (alphabetical + case insensitive)
-        elif section in typed_sections:
-            return 2 * n_sections_splitter + typed_sections.index(section)
+        elif section in typed_sections_positions:
+            return 2 * n_sections_splitter + typed_sections_positions[section]
         # Function sections (numeric order)
-        elif section in functions:
-            return 3 * n_sections_splitter + functions.index(section)
+        elif section in functions_positions:
+            return 3 * n_sections_splitter + functions_positions[section]
         # Legacy sections
-        elif section in CONFIG.sections.legacy_sections:
-            return 4 * n_sections_splitter + CONFIG.sections.legacy_sections.index(
-                section
-            )
+        elif section in legacy_sections_positions:
+            return 4 * n_sections_splitter + legacy_sections_positions[section]
         # Unknown section
         else:
             raise KeyError(f"Unknown section {section}")
 
-    unknown_sections = set(data.keys()) - set(CONFIG.sections.all_sections)
+    unknown_sections = data.keys() - CONFIG.sections.all_sections_set
 
     # Remove functions, these are a special case
     if [section for section in unknown_sections if not section.startswith("FUNCT")]:
@@ -170,12 +242,38 @@ class FourCInput:
     # All sections for which the types are known, aka, non-legacy
     typed_sections_names: list[str] = CONFIG.sections.typed_sections
 
+    # Sets of the section names above for fast membership checks
+    _all_sections_names_set: frozenset[str] = CONFIG.sections.all_sections_set
+    _legacy_sections_names_set: frozenset[str] = CONFIG.sections.legacy_sections_set
+    _typed_sections_names_set: frozenset[str] = CONFIG.sections.typed_sections_set
+
     type_converter: Converter = CONVERTER
 
+    # If all sections are known to be of native Python types, see __init__
+    _converted: bool
+
     def convert_to_native_types(self) -> None:
-        """Convert all sections to native Python types."""
+        """Convert all sections to native Python types.
+
+        Nothing is done if all sections are known to be converted already.
+        """
+        if self._converted:
+            return
+
         self._sections: dict = self.type_converter(self._sections)
         self._legacy_sections: dict = self.type_converter(self._legacy_sections)
+        self._converted = self._converts_types()
+
+    def _converts_types(self) -> bool:
+        """Check if the type converter actually converts objects.
+
+        Without custom converters, objects are passed through as they are. In
+        this case the sections can not be assumed to consist of native types.
+
+        Returns:
+            True if the type converter has custom converters
+        """
+        return self.type_converter.has_custom_converters()
 
     def __init__(
         self,
@@ -189,6 +287,11 @@ class FourCInput:
         self._sections = {}
         self._legacy_sections = {}
 
+        # Flag if all sections are known to be of native Python types. It is reset whenever
+        # unconverted data is set or a reference to the section data is handed out, as the data
+        # could be modified in place.
+        self._converted = True
+
         if sections is not None:
             for k, v in sections.items():
                 self.__setitem__(k, v)
@@ -206,10 +309,10 @@ class FourCInput:
         Returns:
             Initialised object
         """
-        data = load_yaml(input_file_path)
-        if header_only:
-            for section in cls.legacy_sections_names:
-                data.pop(section, None)
+        data = load_yaml(
+            input_file_path,
+            skip_sections=cls.legacy_sections_names if header_only else None,
+        )
         return cls(data)
 
     @property
@@ -219,9 +322,21 @@ class FourCInput:
         Returns:
             dict: With all set sections in inline dat style
         """
-        return self._sections | inline_legacy_sections(
-            self._legacy_sections.copy(), self.legacy_sections_names
-        )
+        self._converted = False
+        return self._inline()
+
+    def _inline(self) -> dict:
+        """Inline the legacy sections and join them with the typed sections.
+
+        Returns:
+            dict: With all set sections in inline dat style
+        """
+        inlined_sections = self._sections.copy()
+        for section_name, section in self._legacy_sections.items():
+            inlined_sections[section_name] = inline_legacy_section(
+                section_name, section, self.legacy_sections_names
+            )
+        return inlined_sections
 
     def __repr__(self) -> str:
         """Representation string.
@@ -256,19 +371,25 @@ class FourCInput:
             key: Section name
             value: Section entry
         """
+        # Section names are compared a lot, interned names can be compared by identity. Subclasses
+        # of str, e.g., numpy.str_, can not be interned.
+        if type(key) is str:
+            key = sys.intern(key)
         value = self.type_converter(value)
+        if not self._converts_types():
+            self._converted = False
         # Warn if complete section is overwritten
-        if key in self.sections:
-            logger.warning(f"Section {key} was overwritten.")
+        if key in self:
+            logger.warning("Section {} was overwritten.", key)
         # Nice sections
-        if is_section_known(key, self.typed_sections_names):
+        if is_section_known(key, self._typed_sections_names_set):
             self._sections[key] = value
         # Legacy sections
-        elif key in self.legacy_sections_names:
+        elif key in self._legacy_sections_names_set:
             # Is a list needs to be interpreted to dict
             if isinstance(value, list):
                 if not any([isinstance(v, dict) for v in value]):
-                    logger.debug(f"Interpreting section {key}")
+                    logger.debug("Interpreting section {}", key)
                     self._legacy_sections[key] = interpret_legacy_section(
                         key, value, self.legacy_sections_names
                     )
@@ -283,9 +404,10 @@ class FourCInput:
         else:
             # Fancy error message
             raise UnknownSectionException(
-                f"Unknown section '{key}'. Did you mean "
-                f"'{difflib.get_close_matches(key.upper(), self.all_sections_names, n=1, cutoff=0.3)[0]}'?"
-                " Call FourCInputFile.known_sections for a complete list."
+                f"Unknown section '{key}'.",
+                key,
+                self.all_sections_names,
+                " Call FourCInputFile.known_sections for a complete list.",
             )
 
     def __getitem__(self, key: str) -> Any:
@@ -298,15 +420,21 @@ class FourCInput:
             Section value
         """
         # Nice sections
-        if is_section_known(key, self.typed_sections_names):
-            return self._sections[key]
+        if is_section_known(key, self._typed_sections_names_set):
+            section = self._sections[key]
+            self._converted = False
+            return section
         # Legacy sections
         elif key in self._legacy_sections:
+            self._converted = False
             return self._legacy_sections[key]
         else:
             sections = "\n - ".join(self.get_section_names())
             raise UnknownSectionException(
-                f"Section '{key}' not set. Did out mean '{difflib.get_close_matches(key.upper(), self.all_sections_names, n=1, cutoff=0.3)[0]}'? The set sections are:\n - {sections}"
+                f"Section '{key}' not set.",
+                key,
+                self.all_sections_names,
+                f" The set sections are:\n - {sections}",
             )
 
     def pop(self, key: str, default_value: Any = NOT_SET) -> Any:
@@ -327,21 +455,24 @@ class FourCInput:
         # Section is not set
         else:
             # Known section
-            if key in self.all_sections_names:
+            if key in self._all_sections_names_set:
                 # Default value was provided
                 if check_if_set(default_value):
                     return default_value
                 # Default value was not provided
                 else:
                     raise UnknownSectionException(
-                        f"Section '{key}' not set. Did out mean '{difflib.get_close_matches(key.upper(), self.get_section_names(), n=1, cutoff=0.3)[0]}'?"
+                        f"Section '{key}' not set.",
+                        key,
+                        self.get_section_names(),
                     )
             # Unknown section
             else:
                 raise UnknownSectionException(
-                    f"Unknown section '{key}'. Did you mean "
-                    f"'{difflib.get_close_matches(key.upper(), self.all_sections_names, n=1, cutoff=0.3)[0]}'?"
-                    " Call FourCInputFile.known_sections for a complete list."
+                    f"Unknown section '{key}'.",
+                    key,
+                    self.all_sections_names,
+                    " Call FourCInputFile.known_sections for a complete list.",
                 )
 
     def combine_sections(self, other: dict | FourCInput) -> None:
@@ -352,26 +483,36 @@ class FourCInput:
         Args:
             other: Sections to be combined
         """
+        self._combine_sections(other, copy_data=True)
+
+    def _combine_sections(self, other: dict | FourCInput, copy_data: bool) -> None:
+        """Combine input files together.
+
+        Args:
+            other: Sections to be combined
+            copy_data: Copy the section data of inputs of the same type
+        """
         other_sections_names: Any = None
 
         if isinstance(other, dict):
             other_sections_names = other.keys()
         elif isinstance(other, FourCInput):
-            other_sections_names = other.get_section_names()
+            other_sections_names = (
+                other._sections.keys() | other._legacy_sections.keys()
+            )
         else:
             raise TypeError(
                 f"Cannot combine sections between {type(self)} and {type(other)}."
             )
 
-        # Sections that can be found in both
-        if doubled_defined_sections := set(self.get_section_names()) & set(
-            other_sections_names  # type: ignore
-        ):
+        # Sections that can be found in both, the dict views allow set operations without copies
+        sections_names = self._sections.keys() | self._legacy_sections.keys()
+        if doubled_defined_sections := sections_names & other_sections_names:
             raise ValueError(
-                f"Section(s) {', '.join(list(doubled_defined_sections))} are defined in both {type(self).__name__} objects. In order to join the {type(self).__name__} objects remove the section(s) in one of them."
+                f"Section(s) {', '.join(doubled_defined_sections)} are defined in both {type(self).__name__} objects. In order to join the {type(self).__name__} objects remove the section(s) in one of them."
             )
 
-        self.overwrite_sections(other)
+        self._overwrite_sections(other, copy_data)
 
     def overwrite_sections(self, other: dict | FourCInput) -> None:
         """Overwrite sections from dict or FourCInput.
@@ -383,7 +524,35 @@ class FourCInput:
         Args:
             other: Sections to be updated
         """
-        if isinstance(other, (dict, FourCInput)):
+        self._overwrite_sections(other, copy_data=True)
+
+    def _overwrite_sections(self, other: dict | FourCInput, copy_data: bool) -> None:
+        """Overwrite sections from dict or FourCInput.
+
+        Args:
+            other: Sections to be updated
+            copy_data: Copy the section data of inputs of the same type
+        """
+        # Sections of the same input type are already sorted, interpreted and converted
+        if type(other) is type(self):
+            for key in (self._sections.keys() | self._legacy_sections.keys()) & (
+                other._sections.keys() | other._legacy_sections.keys()
+            ):
+                logger.warning("Section {} was overwritten.", key)
+
+            # With custom converters, setting the sections creates new containers, so the data is
+            # copied to keep both inputs independent. Otherwise the data is shared as when setting
+            # the sections one by one.
+            if copy_data and self._converts_types():
+                self._sections.update(copy_nested_dicts_or_lists(other._sections))
+                self._legacy_sections.update(
+                    copy_nested_dicts_or_lists(other._legacy_sections)
+                )
+            else:
+                self._sections.update(other._sections)
+                self._legacy_sections.update(other._legacy_sections)
+            self._converted = self._converted and other._converted
+        elif isinstance(other, (dict, FourCInput)):
             for key, value in other.items():
                 self[key] = value
         else:
@@ -411,7 +580,7 @@ class FourCInput:
         for section_key in default_sections:
             if not isinstance(default_sections[section_key], dict):
                 raise TypeError(f"Section {section_key} does not contain a dict.")
-            if section_key in self.sections:
+            if section_key in self:
                 # only check sections that are contained in the current object and in the default_sections
                 for parameter_key in default_sections[section_key]:
                     if parameter_key not in self[section_key]:
@@ -419,7 +588,10 @@ class FourCInput:
                             section_key
                         ][parameter_key]
                         logger.debug(
-                            "Setting user default value {default_sections[section_key]} to parameter {parameter_key} in section {section_key}"
+                            "Setting user default value {} to parameter {} in section {}",
+                            default_sections[section_key][parameter_key],
+                            parameter_key,
+                            section_key,
                         )
                         continue
                     if (
@@ -437,7 +609,9 @@ class FourCInput:
             else:
                 # take the section content from default if it is not in the current object
                 self[section_key] = default_sections[section_key]
-                logger.debug(f"Adding user default section {section_key} to input file")
+                logger.debug(
+                    "Adding user default section {} to input file", section_key
+                )
 
     @property
     def sections(self) -> dict:
@@ -446,6 +620,7 @@ class FourCInput:
         Returns:
             dict: Set sections
         """
+        self._converted = False
         return self._sections | self._legacy_sections
 
     def get_section_names(self) -> list:
@@ -454,7 +629,7 @@ class FourCInput:
         Returns:
             list: Sorted section names
         """
-        return sorted(list(self._legacy_sections) + list(self._sections))
+        return sorted(itertools.chain(self._legacy_sections, self._sections))
 
     def items(self) -> Any:
         """Get items.
@@ -464,7 +639,8 @@ class FourCInput:
         Returns:
             dict_items: Dict items
         """
-        return (self.sections).items()
+        self._converted = False
+        return (self._sections | self._legacy_sections).items()
 
     def __contains__(self, item: str) -> bool:
         """Contains function.
@@ -477,7 +653,7 @@ class FourCInput:
         Returns:
             True if section is set
         """
-        return item in (list(self._legacy_sections) + list(self._sections))
+        return item in self._sections or item in self._legacy_sections
 
     def __add__(self, other: FourCInput) -> FourCInput:
         """Add two input file objects together.
@@ -500,14 +676,20 @@ class FourCInput:
         Returns:
             FourCInputFile: Copy of current object
         """
-        return copy.deepcopy(self)
+        copied_object = copy.copy(self)
+        copied_object._sections = copy_nested_dicts_or_lists(self._sections)
+        copied_object._legacy_sections = copy_nested_dicts_or_lists(
+            self._legacy_sections
+        )
+        return copied_object
 
     def load_includes(self) -> None:
         """Load data from the includes section."""
         if includes := self.pop("INCLUDES", None):
             for partial_file in includes:
-                logger.debug(f"Gather data from {partial_file}")
-                self.combine_sections(self.from_4C_yaml(partial_file))
+                logger.debug("Gather data from {}", partial_file)
+                # The partial inputs are temporary, hence their data is not copied
+                self._combine_sections(self.from_4C_yaml(partial_file), copy_data=False)
 
     def dump(
         self,
@@ -542,7 +724,9 @@ class FourCInput:
         if convert_to_native_types:
             self.convert_to_native_types()
 
-        dump_yaml(self.inlined, input_file_path, sort_function, use_fourcipp_yaml_style)
+        dump_yaml(
+            self._inline(), input_file_path, sort_function, use_fourcipp_yaml_style
+        )
 
     def validate(
         self,
@@ -553,29 +737,30 @@ class FourCInput:
         """Validate input file.
 
         Args:
-            json_schema: Schema to check the data
+            json_schema: Schema to check the data. The compiled validator is cached per schema
+                object, so the schema must not be modified after its first use.
             sections_only: Validate each section independently.
                 Requiredness of the sections themselves is ignored.
             convert_to_native_types: Convert all sections to native Python types
         """
-        validation_schema = json_schema
-
-        # Remove the requiredness of the sections
-        if sections_only:
-            validation_schema = json_schema.copy()
-            validation_schema.pop("required")
-
         if convert_to_native_types:
             self.convert_to_native_types()
 
-        # Validate sections using schema
-        validate_using_json_schema(self._sections, validation_schema)
+        # Validate sections using schema, the requiredness of the sections is removed if desired
+        validate_using_json_schema(
+            self._sections, json_schema, ignore_required=sections_only
+        )
 
-        # Legacy sections are only checked if they are of type string
-        for section_name, section in inline_legacy_sections(
-            self._legacy_sections.copy(), self.legacy_sections_names
-        ).items():
-            for i, k in enumerate(section):
+        # Legacy sections are only checked if they are of type string, each section is inlined on
+        # its own so that no copy of all legacy sections is created
+        for section_name, section in self._legacy_sections.items():
+            inlined_section = inline_legacy_section(
+                section_name, section, self.legacy_sections_names
+            )
+            # Fast check, the position of the entry is only searched for the error message
+            if all(map(str.__instancecheck__, inlined_section)):
+                continue
+            for i, k in enumerate(inlined_section):
                 if not isinstance(k, str):
                     raise ValidationError(
                         f"Could not validate the legacy section {section_name}, since entry {i}:\n{k} is not a string"
@@ -652,7 +837,10 @@ class FourCInput:
         if not isinstance(other, type(self)):
             raise TypeError(f"Can not compare types {type(self)} and {type(other)}")
 
-        return self.sections == other.sections
+        return (
+            self._sections == other._sections
+            and self._legacy_sections == other._legacy_sections
+        )
 
     def compare(
         self,
@@ -694,4 +882,6 @@ class FourCInput:
         Returns:
             FourCInput: Input with only the non-legacy sections
         """
+        # The sections are shared with the extracted input
+        self._converted = False
         return FourCInput(sections=self._sections)
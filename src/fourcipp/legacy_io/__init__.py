@@ -21,10 +21,12 @@
 # THE SOFTWARE.
 """Modules related to legacy io."""
 
+import re
 from collections.abc import Callable, Sequence
+from functools import lru_cache, partial
 
 from fourcipp.legacy_io.element import read_element, write_element
-from fourcipp.legacy_io.node import read_node, write_node
+from fourcipp.legacy_io.node import read_nodes, write_node
 from fourcipp.legacy_io.node_topology import read_node_topology, write_node_topology
 from fourcipp.legacy_io.particle import read_particle, write_particle
 from fourcipp.utils.type_hinting import T
@@ -43,6 +45,85 @@ def _iterate_and_evaluate(function: Callable[..., T], iterable: Sequence) -> lis
     return [function(line) for line in iterable]
 
 
+# Readers and writers of the legacy sections. Sections are matched by their full name first and
+# subsequently by their suffix.
+_READERS_BY_NAME: dict[str, Callable[[Sequence], list]] = {
+    "PARTICLES": partial(_iterate_and_evaluate, read_particle),
+    "NODE COORDS": read_nodes,
+}
+_READERS_BY_SUFFIX: dict[str, Callable[[Sequence], list]] = {
+    "ELEMENTS": partial(_iterate_and_evaluate, read_element),
+    "NODE TOPOLOGY": partial(_iterate_and_evaluate, read_node_topology),
+}
+_WRITERS_BY_NAME: dict[str, Callable[[Sequence], list]] = {
+    "PARTICLES": partial(_iterate_and_evaluate, write_particle),
+    "NODE COORDS": partial(_iterate_and_evaluate, write_node),
+}
+_WRITERS_BY_SUFFIX: dict[str, Callable[[Sequence], list]] = {
+    "ELEMENTS": partial(_iterate_and_evaluate, write_element),
+    "NODE TOPOLOGY": partial(_iterate_and_evaluate, write_node_topology),
+}
+
+# Extracts the known suffix of a section name in a single pass
+_SUFFIX_PATTERN = re.compile(
+    "(" + "|".join(re.escape(suffix) for suffix in _READERS_BY_SUFFIX) + r")\Z"
+)
+
+# The handler lookups are cached per section name. The cache is bounded as arbitrary section names
+# can be passed to the public functions, while only a few legacy sections exist.
+_MAX_CACHED_HANDLERS = 64
+
+
+def _find_handler(
+    legacy_section: str,
+    handlers_by_name: dict[str, Callable[[Sequence], list]],
+    handlers_by_suffix: dict[str, Callable[[Sequence], list]],
+) -> Callable[[Sequence], list] | None:
+    """Find the handler for a legacy section.
+
+    Args:
+        legacy_section: Section name
+        handlers_by_name: Handlers for sections matched by their full name
+        handlers_by_suffix: Handlers for sections matched by their suffix
+
+    Returns:
+        Handler for the section, None if no handler was found
+    """
+    if handler := handlers_by_name.get(legacy_section):
+        return handler
+
+    if match := _SUFFIX_PATTERN.search(legacy_section):
+        return handlers_by_suffix.get(match.group(1))
+
+    return None
+
+
+@lru_cache(maxsize=_MAX_CACHED_HANDLERS)
+def _get_reader(legacy_section: str) -> Callable[[Sequence], list] | None:
+    """Get reader for a legacy section.
+
+    Args:
+        legacy_section: Section name
+
+    Returns:
+        Reader for the section, None if no reader was found
+    """
+    return _find_handler(legacy_section, _READERS_BY_NAME, _READERS_BY_SUFFIX)
+
+
+@lru_cache(maxsize=_MAX_CACHED_HANDLERS)
+def _get_writer(legacy_section: str) -> Callable[[Sequence], list] | None:
+    """Get writer for a legacy section.
+
+    Args:
+        legacy_section: Section name
+
+    Returns:
+        Writer for the section, None if no writer was found
+    """
+    return _find_handler(legacy_section, _WRITERS_BY_NAME, _WRITERS_BY_SUFFIX)
+
+
 def interpret_legacy_section(
     legacy_section: str, section_data: list, known_legacy_sections: list
 ) -> dict | list:
@@ -63,23 +144,12 @@ def interpret_legacy_section(
             f"Section {legacy_section} is not a known legacy section. Current legacy sections are {', '.join(known_legacy_sections)}"
         )
 
-    match legacy_section:
-        case "PARTICLES":
-            return _iterate_and_evaluate(read_particle, section_data)
-
-        case "NODE COORDS":
-            return _iterate_and_evaluate(read_node, section_data)
-
-        case _ if legacy_section.endswith("ELEMENTS"):
-            return _iterate_and_evaluate(read_element, section_data)
-
-        case _ if legacy_section.endswith("NODE TOPOLOGY"):
-            return _iterate_and_evaluate(read_node_topology, section_data)
+    if (reader := _get_reader(legacy_section)) is None:
+        raise NotImplementedError(
+            f"Legacy section {legacy_section} is not implemented."
+        )
 
-        case _:
-            raise NotImplementedError(
-                f"Legacy section {legacy_section} is not implemented."
-            )
+    return reader(section_data)
 
 
 def interpret_legacy_sections(
@@ -116,32 +186,15 @@ def inline_legacy_section(
     Returns:
         Inlined data
     """
+    if (writer := _get_writer(legacy_section)) is None:
+        raise ValueError(
+            f"Section {legacy_section} is not a known legacy section. Current legacy sections are {', '.join(known_legacy_sections)}"
+        )
+
+    if not isinstance(section_data, Sequence):
+        raise TypeError("Expected the section data to be of type list.")
 
-    match legacy_section:
-        case "PARTICLES":
-            if not isinstance(section_data, Sequence):
-                raise TypeError("Expected the section data to be of type list.")
-            return _iterate_and_evaluate(write_particle, section_data)
-
-        case "NODE COORDS":
-            if not isinstance(section_data, Sequence):
-                raise TypeError("Expected the section data to be of type list.")
-            return _iterate_and_evaluate(write_node, section_data)
-
-        case _ if legacy_section.endswith("ELEMENTS"):
-            if not isinstance(section_data, Sequence):
-                raise TypeError("Expected the section data to be of type list.")
-            return _iterate_and_evaluate(write_element, section_data)
-
-        case _ if legacy_section.endswith("NODE TOPOLOGY"):
-            if not isinstance(section_data, Sequence):
-                raise TypeError("Expected the section data to be of type list.")
-            return _iterate_and_evaluate(write_node_topology, section_data)
-
-        case _:
-            raise ValueError(
-                f"Section {legacy_section} is not a known legacy section. Current legacy sections are {', '.join(known_legacy_sections)}"
-            )
+    return writer(section_data)
 
 
 def inline_legacy_sections(legacy_sections: dict, known_legacy_sections: list) -> dict:
@@ -120,16 +120,17 @@ def write_element(element: dict) -> str:
     Returns:
         element line
     """
-    line = " ".join(
-        [
-            to_dat_string(element["id"]),
-            to_dat_string(element["data"]["type"]),
-            to_dat_string(element["cell"]["type"]),
-            to_dat_string(element["cell"]["connectivity"]),
-        ]
-    )
+    # Collect the entries and join them once, this is a lot faster than repeated string additions
+    cell = element["cell"]
+    entries = [
+        to_dat_string(element["id"]),
+        to_dat_string(element["data"]["type"]),
+        to_dat_string(cell["type"]),
+        to_dat_string(cell["connectivity"]),
+    ]
     for k, v in element["data"].items():
         if k == "type":
             continue
-        line += " " + k + " " + to_dat_string(v)
-    return line
+        entries.append(k)
+        entries.append(to_dat_string(v))
+    return " ".join(entries)
@@ -25,10 +25,12 @@ Once this section is implemented in 4C using InputSpec, this file can be
 simplified.
 """
 
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 from functools import partial
 from typing import Any, Literal
 
+import numpy as np
+
 from fourcipp.legacy_io.inline_dat import _extract_entry, _extract_vector, to_dat_string
 
 _FNODE_CASTING: dict[str, Callable] = {
@@ -39,6 +41,9 @@ _FNODE_CASTING: dict[str, Callable] = {
     "TRANS": partial(_extract_entry, extractor=float),
 }
 
+# Columns of standard node sections, the ids are parsed as integers to be exact
+_NODE_TABLE_DTYPE = np.dtype([("id", np.int64), ("COORD", np.float64, (3,))])
+
 
 def read_node(line: str) -> dict:
     """Read node.
@@ -86,6 +91,37 @@ def read_node(line: str) -> dict:
     raise ValueError(f"Unknown node type {node_type}")
 
 
+def read_nodes(lines: Sequence[str]) -> list[dict]:
+    """Read nodes.
+
+    Sections with only standard nodes, i.e., the usual case for large meshes, are parsed column-wise
+    using NumPy. All other sections are read line by line.
+
+    Args:
+        lines: Inline dat descriptions of the nodes
+
+    Returns:
+        Nodes as dicts
+    """
+    if lines and all(line.startswith("NODE ") for line in lines):
+        try:
+            table = np.loadtxt(
+                lines, dtype=_NODE_TABLE_DTYPE, usecols=(1, 3, 4, 5), ndmin=1
+            )
+        except ValueError:
+            # Not a regular table, e.g., missing entries
+            pass
+        else:
+            return [
+                {"id": node_id, "COORD": coordinate, "data": {"type": "NODE"}}
+                for node_id, coordinate in zip(
+                    table["id"].tolist(), table["COORD"].tolist()
+                )
+            ]
+
+    return [read_node(line) for line in lines]
+
+
 def write_node(node: dict) -> str:
     """Write node as line.
 
@@ -105,10 +141,12 @@ def write_node(node: dict) -> str:
         return line + " " + str(node["data"]["weight"])
 
     if node_type == "FNODE":
+        entries = [line]
         for k, v in node["data"].items():
             if k == "type":
                 continue
-            line += f" {k} {to_dat_string(v)}"
-        return line
+            entries.append(k)
+            entries.append(to_dat_string(v))
+        return " ".join(entries)
 
     raise ValueError(f"Unknown node type {node_type}")
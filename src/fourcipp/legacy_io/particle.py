@@ -60,12 +60,4 @@ def write_particle(particle: dict) -> str:
     Returns:
         Particle line
     """
-    line = ""
-
-    for k, v in particle.items():
-        if line:
-            line += " "
-
-        line += k + " " + to_dat_string(v)
-
-    return line
+    return " ".join([k + " " + to_dat_string(v) for k, v in particle.items()])
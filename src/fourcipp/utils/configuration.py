@@ -25,6 +25,7 @@ from __future__ import annotations
 
 import copy
 import pathlib
+import sys
 from dataclasses import dataclass, field
 
 from loguru import logger
@@ -44,9 +45,15 @@ class Sections:
             legacy_sections: Legacy sections, i.e., their information is not provided in the schema file
             typed_sections: Typed sections, non-legacy sections natively supported by the schema
         """
-        self.legacy_sections: list[str] = legacy_sections
-        self.typed_sections: list[str] = typed_sections
-        self.all_sections: list[str] = typed_sections + legacy_sections
+        # Section names are interned, so lookups of interned keys can be resolved by identity
+        self.legacy_sections: list[str] = [sys.intern(s) for s in legacy_sections]
+        self.typed_sections: list[str] = [sys.intern(s) for s in typed_sections]
+        self.all_sections: list[str] = self.typed_sections + self.legacy_sections
+
+        # Sets of the section names for fast membership checks
+        self.legacy_sections_set: frozenset[str] = frozenset(self.legacy_sections)
+        self.typed_sections_set: frozenset[str] = frozenset(self.typed_sections)
+        self.all_sections_set: frozenset[str] = frozenset(self.all_sections)
 
     @classmethod
     def from_metadata(cls, fourc_metadata: dict) -> Sections:
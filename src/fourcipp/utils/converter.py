@@ -91,6 +91,16 @@ class Converter:
         self.register_type(np.ndarray, convert_ndarray)
         return self
 
+    def has_custom_converters(self) -> bool:
+        """Check if custom converters are registered.
+
+        Without custom converters, objects are returned as they are.
+
+        Returns:
+            True if at least one custom converter is registered
+        """
+        return bool(self._custom_converters)
+
     def __call__(self, obj: Any) -> Any:
         """Convert the object to a native Python type.
 
@@ -98,7 +108,7 @@ class Converter:
             obj: Object to convert
         """
         # If no custom converters are present, no need to do a conversion
-        if not self._custom_converters:
+        if not self.has_custom_converters():
             return obj
 
         # Look if object is present in the custom converters
@@ -21,6 +21,7 @@
 # THE SOFTWARE.
 """Dict utils."""
 
+import copy
 from collections.abc import Callable, Iterator, Sequence
 from typing import Any
 
@@ -132,6 +133,31 @@ def compare_nested_dicts_or_lists(
     return True
 
 
+def copy_nested_dicts_or_lists(obj: Any) -> Any:
+    """Recursively copy nested dictionaries or lists.
+
+    In contrast to `copy.deepcopy`, dicts and lists are copied directly and immutable native
+    objects are reused. All other objects are copied with `copy.deepcopy`.
+
+    Args:
+        obj: Object to copy
+
+    Returns:
+        Copy of the object
+    """
+    # Immutable objects can be shared
+    if obj is None or type(obj) in (str, int, float, bool):
+        return obj
+
+    if type(obj) is dict:
+        return {key: copy_nested_dicts_or_lists(value) for key, value in obj.items()}
+
+    if type(obj) is list:
+        return [copy_nested_dicts_or_lists(item) for item in obj]
+
+    return copy.deepcopy(obj)
+
+
 def _get_dict(
     nested_dict: dict | list, keys: Sequence, optional: bool = True
 ) -> Iterator[dict]:
@@ -164,7 +190,7 @@ def _get_dict(
                 else:
                     # Unknown key
                     if optional:
-                        logger.debug(f"Entry {keys} not found and is set as optional")
+                        logger.debug("Entry {} not found and is set as optional", keys)
                         return
                     else:
                         raise KeyError(
@@ -228,7 +254,7 @@ def _split_off_last_key(
         # Key has to be provided
         if last_key not in entry:
             if optional:
-                logger.debug(f"Entry {keys} not found and was set to optional.")
+                logger.debug("Entry {} not found and was set to optional.", keys)
                 # Still return the dict
                 if yield_dict_if_missing:
                     yield entry, last_key
@@ -288,7 +314,9 @@ def replace_value(
         new_value: New value to set
     """
     for entry, last_key in _split_off_last_key(nested_dict, keys):
-        logger.debug(f"Replacing {last_key}: from {entry[last_key]} to {new_value}")
+        logger.debug(
+            "Replacing {}: from {} to {}", last_key, entry[last_key], new_value
+        )
         entry[last_key] = new_value
 
 
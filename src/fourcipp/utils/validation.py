@@ -25,6 +25,7 @@ from __future__ import annotations
 
 import sys
 from collections.abc import Iterable, Sequence
+from typing import Any
 
 import jsonschema_rs
 
@@ -33,6 +34,15 @@ from fourcipp.utils.yaml_io import dict_to_yaml_string
 MAX_INT = 2_147_483_647  # C++ value
 MAX_FLOAT = sys.float_info.max
 
+# Compiled validators, keyed by the id of the schema, whether the required keys are ignored and the
+# compiled top level properties. The schema itself is stored as well, this keeps the id valid and
+# allows to detect reused ids.
+_VALIDATOR_CACHE: dict[tuple[int, bool, frozenset[str] | None], tuple[dict, Any]] = {}
+_MAX_CACHED_VALIDATORS = 64
+
+# JSON schema keywords referencing other parts of the schema
+_REFERENCE_KEYWORDS = frozenset(["$ref", "$dynamicRef", "$recursiveRef"])
+
 
 class ValidationError(Exception):
     """FourCIPP validation error."""
@@ -128,17 +138,88 @@ def find_keys_exceeding_max_value(
         yield path_for_data, obj
 
 
-def validate_using_json_schema(data: dict, json_schema: dict) -> bool:
+def contains_reference(obj: object) -> bool:
+    """Check if a (sub)schema contains references.
+
+    Args:
+        obj: Schema or part of the schema to check
+
+    Returns:
+        True if a reference was found
+    """
+    if isinstance(obj, dict):
+        if not _REFERENCE_KEYWORDS.isdisjoint(obj):
+            return True
+        return any(contains_reference(value) for value in obj.values())
+    if isinstance(obj, list):
+        return any(contains_reference(item) for item in obj)
+    return False
+
+
+def get_validator(
+    json_schema: dict,
+    ignore_required: bool = False,
+    properties: Iterable[str] | None = None,
+) -> Any:
+    """Get compiled validator for a JSON schema.
+
+    Compiling the schema is expensive, hence the validators are cached per schema object. The
+    schema must therefore not be modified after its first use.
+
+    Args:
+        json_schema: Schema for validation
+        ignore_required: Ignore the top level required keys of the schema
+        properties: Only compile the schema of these top level properties. Data with other
+            properties is validated as if these were not part of the schema.
+
+    Returns:
+        Compiled validator
+    """
+    if properties is not None:
+        properties = frozenset(properties)
+    key = (id(json_schema), ignore_required, properties)
+    cached = _VALIDATOR_CACHE.get(key)
+
+    if cached is None or cached[0] is not json_schema:
+        validation_schema = json_schema.copy()
+        if ignore_required:
+            validation_schema.pop("required", None)
+        if properties is not None and "properties" in json_schema:
+            validation_schema["properties"] = {
+                k: v for k, v in json_schema["properties"].items() if k in properties
+            }
+
+            # References could point to the removed properties, use the complete schema instead
+            if contains_reference(validation_schema):
+                validation_schema["properties"] = json_schema["properties"]
+
+        # Drop the oldest validator
+        if len(_VALIDATOR_CACHE) >= _MAX_CACHED_VALIDATORS:
+            del _VALIDATOR_CACHE[next(iter(_VALIDATOR_CACHE))]
+
+        cached = (json_schema, jsonschema_rs.validator_for(validation_schema))
+        _VALIDATOR_CACHE[key] = cached
+
+    return cached[1]
+
+
+def validate_using_json_schema(
+    data: dict, json_schema: dict, ignore_required: bool = False
+) -> bool:
     """Validate data using a JSON schema.
 
+    Only the schema of the top level properties set in the data are compiled, which is a lot cheaper
+    than compiling the complete schema.
+
     Args:
         data: Data to validate
-        json_schema: Schema for validation
+        json_schema: Schema for validation, must not be modified after its first use
+        ignore_required: Ignore the top level required keys of the schema
 
     Returns:
         True if successful
     """
-    validator = jsonschema_rs.validator_for(json_schema)
+    validator = get_validator(json_schema, ignore_required, properties=data.keys())
     try:
         validator.validate(data)
     except jsonschema_rs.ValidationError as exception:
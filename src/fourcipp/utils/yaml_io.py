@@ -23,6 +23,7 @@
 
 import json
 import pathlib
+from collections.abc import Iterable
 from typing import Callable
 
 import regex
@@ -30,8 +31,35 @@ import ryml
 
 from fourcipp.utils.type_hinting import Path
 
+# Patterns to fix the JSON string emitted by rapidyaml, compiled once on import
+_INF_PATTERN = regex.compile(r":\s*(-?)inf\b")
+_MISSING_LEADING_DIGIT_PATTERN = regex.compile(r":\s*(-?)\.([0-9]+)")
+_MISSING_TRAILING_DIGIT_PATTERN = regex.compile(r":\s*(-?)([0-9]+)\.(\D)")
+_VECTOR_COMMA_PATTERN = regex.compile(r"(?<=\d),(?=\d)|(?<=\]),(?=\[)")
 
-def load_yaml(path_to_yaml_file: Path) -> dict:
+
+def _remove_top_level_nodes(tree: ryml.Tree, keys: set[str]) -> None:
+    """Remove top level nodes from the tree.
+
+    Args:
+        tree: Tree to remove the nodes from
+        keys: Keys of the nodes to remove
+    """
+    root_id = tree.root_id()
+    if not tree.is_map(root_id):
+        return
+
+    node_id = tree.first_child(root_id)
+    while node_id != ryml.NONE:
+        next_node_id = tree.next_sibling(node_id)
+        if tree.key(node_id).tobytes().decode("utf8") in keys:
+            tree.remove(node_id)
+        node_id = next_node_id
+
+
+def load_yaml(
+    path_to_yaml_file: Path, skip_sections: Iterable[str] | None = None
+) -> dict:
     """Load yaml files.
 
     rapidyaml is the fastest yaml parsing library we could find. Since it returns custom objects we
@@ -40,22 +68,28 @@ def load_yaml(path_to_yaml_file: Path) -> dict:
 
     Args:
         path_to_yaml_file: Path to yaml file
+        skip_sections: Top level sections which are removed from the tree before emitting it, i.e.,
+            no Python objects are created for them
 
     Returns:
        Loaded data
     """
+    tree = ryml.parse_in_arena(pathlib.Path(path_to_yaml_file).read_bytes())
 
-    json_str = ryml.emit_json(
-        ryml.parse_in_arena(pathlib.Path(path_to_yaml_file).read_bytes())
-    )
+    if skip_sections is not None:
+        _remove_top_level_nodes(tree, set(skip_sections))
+
+    json_str = ryml.emit_json(tree)
 
     # Convert `inf` to a string to avoid JSON parsing errors, see https://github.com/biojppm/rapidyaml/issues/312
-    json_str = regex.sub(r":\s*(-?)inf\b", r': "\1inf"', json_str)
+    # The substring check is a lot cheaper than the regex, and `inf` is rare in input files
+    if "inf" in json_str:
+        json_str = _INF_PATTERN.sub(r': "\1inf"', json_str)
 
     # Convert floats that are missing digits on either side of the decimal point
     # so .5 to 0.5 and 5. to 5.0
-    json_str = regex.sub(r":\s*(-?)\.([0-9]+)", r": \g<1>0.\2", json_str)
-    json_str = regex.sub(r":\s*(-?)([0-9]+)\.(\D)", r": \1\2.0\3", json_str)
+    json_str = _MISSING_LEADING_DIGIT_PATTERN.sub(r": \g<1>0.\2", json_str)
+    json_str = _MISSING_TRAILING_DIGIT_PATTERN.sub(r": \1\2.0\3", json_str)
 
     data = json.loads(json_str)
 
@@ -147,7 +181,7 @@ def dict_to_yaml_string(
 
     if use_fourcipp_yaml_style:
         # add spaces after commas in vectors
-        yaml_string = regex.sub(r"(?<=\d),(?=\d)|(?<=\]),(?=\[)", ", ", yaml_string)
+        yaml_string = _VECTOR_COMMA_PATTERN.sub(", ", yaml_string)
 
     return yaml_string
 
@@ -23,7 +23,14 @@
 
 import pytest
 
-from fourcipp.legacy_io import inline_legacy_section, interpret_legacy_section
+from fourcipp.legacy_io import (
+    _MAX_CACHED_HANDLERS,
+    _READERS_BY_SUFFIX,
+    _find_handler,
+    _get_writer,
+    inline_legacy_section,
+    interpret_legacy_section,
+)
 
 
 @pytest.mark.parametrize("function", [interpret_legacy_section, inline_legacy_section])
@@ -35,3 +42,43 @@ def test_unknown_section(function):
             {"dummy": "data"},
             known_legacy_sections=["the", "known", "sections"],
         )
+
+
+def test_not_implemented_section():
+    """Test known section without reader."""
+    with pytest.raises(NotImplementedError, match="is not implemented"):
+        interpret_legacy_section(
+            "NOT IMPLEMENTED", [], known_legacy_sections=["NOT IMPLEMENTED"]
+        )
+
+
+def test_inline_section_wrong_type():
+    """Test inlining of section data which is not a list."""
+    with pytest.raises(TypeError, match="Expected the section data"):
+        inline_legacy_section(
+            "STRUCTURE ELEMENTS", {"dummy": "data"}, known_legacy_sections=[]
+        )
+
+
+@pytest.mark.parametrize(
+    "legacy_section, suffix",
+    [
+        ("STRUCTURE ELEMENTS", "ELEMENTS"),
+        ("DSURF-NODE TOPOLOGY", "NODE TOPOLOGY"),
+        ("ELEMENTS OF STRUCTURE", None),
+        ("NODE TOPOLOGY ", None),
+    ],
+)
+def test_find_handler_by_suffix(legacy_section, suffix):
+    """Test if handlers are found by the suffix of the section name."""
+    handler = _find_handler(legacy_section, {}, _READERS_BY_SUFFIX)
+    assert handler is _READERS_BY_SUFFIX.get(suffix)
+
+
+def test_handler_cache_is_bounded():
+    """Test if unknown section names do not grow the handler cache."""
+    for i in range(2 * _MAX_CACHED_HANDLERS):
+        with pytest.raises(ValueError, match="Section "):
+            inline_legacy_section(f"UNKNOWN {i}", [], known_legacy_sections=[])
+
+    assert _get_writer.cache_info().currsize <= _MAX_CACHED_HANDLERS
@@ -23,7 +23,7 @@
 
 import pytest
 
-from fourcipp.legacy_io.node import read_node, write_node
+from fourcipp.legacy_io.node import read_node, read_nodes, write_node
 
 
 @pytest.mark.parametrize(
@@ -51,3 +51,19 @@ def test_unknown_node_write():
     unknown_node = {"id": 5, "COORD": [0.0, 0.1, 0.2], "data": {"type": "NOPE"}}
     with pytest.raises(ValueError, match="Unknown node type"):
         write_node(unknown_node)
+
+
+@pytest.mark.parametrize(
+    "node_lines",
+    [
+        ["NODE 1 COORD 0.0 0.1 0.2", "NODE 2 COORD 1e-3 -1.0 2"],
+        ["NODE 9007199254740993 COORD 0.0 0.1 0.2"],
+        ["NODE 1 COORD 0.0 0.1 0.2", "CP 5 COORD 0.0 0.1 0.2 0.3"],
+        ["NODE 1 COORD 0.0 0.1 0.2", "NODE 2 COORD 0.0 0.1"],
+        [],
+    ],
+)
+def test_read_nodes(node_lines):
+    """Test if reading multiple nodes is identical to reading them line by
+    line."""
+    assert read_nodes(node_lines) == [read_node(line) for line in node_lines]
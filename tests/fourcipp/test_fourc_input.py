@@ -28,15 +28,18 @@ import subprocess
 import time
 from collections.abc import Callable
 
+import numpy as np
 import pytest
 
 from fourcipp import CONFIG
+from fourcipp import fourc_input as fourc_input_module
 from fourcipp.fourc_input import (
     FourCInput,
     UnknownSectionException,
     sort_by_section_names,
 )
 from fourcipp.utils.cli import modify_input_with_defaults
+from fourcipp.utils.converter import Converter
 from fourcipp.utils.validation import ValidationError
 
 from ..fourcipp.legacy_io.test_element import (  # noqa: TID252
@@ -139,6 +142,12 @@ def test_set_section(fourc_input, section_names, section_names_2, dummy_data):
     assert fourc_input.get_section_names() == combined_section_names
 
 
+def test_set_section_with_str_subclass(fourc_input, section_names, dummy_data):
+    """Test setting section with a subclass of str as name."""
+    fourc_input[np.str_(section_names[0])] = dummy_data
+    assert fourc_input[section_names[0]] == dummy_data
+
+
 def test_set_section_failure(fourc_input, dummy_data):
     """Test setting section failure."""
     with pytest.raises(UnknownSectionException, match="Unknown section"):
@@ -183,6 +192,46 @@ def test_pop_but_no_default(fourc_input, section_names_2):
         fourc_input.pop(section_names_2[0])
 
 
+def test_pop_but_no_default_empty_input(section_names_2):
+    """Test pop with no default and without any set sections."""
+    with pytest.raises(UnknownSectionException, match="not set"):
+        FourCInput().pop(section_names_2[0])
+
+
+def test_unknown_section_suggestion(fourc_input, dummy_data):
+    """Test if a similar section name is suggested."""
+    with pytest.raises(UnknownSectionException, match="Did you mean 'PROBLEM TYPE'"):
+        fourc_input["problem typ"] = dummy_data
+
+
+def test_unknown_section_exception_message():
+    """Test if the suggestion is inserted into the message."""
+    exception = UnknownSectionException(
+        "Unknown section 'io'.", "io", ["IO", "PROBLEM TYPE"], " More text."
+    )
+    assert exception.args == ("Unknown section 'io'. More text.",)
+
+    message = "Unknown section 'io'. Did you mean 'IO'? More text."
+    assert str(exception) == message
+    assert exception.args == (message,)
+    assert repr(exception) == f"UnknownSectionException({message!r})"
+
+    exception = UnknownSectionException("Unknown section.", "io", [])
+    assert str(exception) == "Unknown section."
+
+
+def test_unknown_section_exception_suggestion_is_cached(monkeypatch):
+    """Test if the suggestion is only computed once."""
+    exception = UnknownSectionException("Unknown section 'io'.", "io", ["IO"])
+    str(exception)
+
+    def fail(*args):
+        raise AssertionError("Suggestion was computed again")
+
+    monkeypatch.setattr(fourc_input_module, "_did_you_mean", fail)
+    assert str(exception) == "Unknown section 'io'. Did you mean 'IO'?"
+
+
 def test_pop_with_default_but_set(fourc_input, section_names, dummy_data):
     """Test pop with default."""
     data = fourc_input.pop(section_names[0], "default value")
@@ -203,6 +252,16 @@ def test_items(fourc_input, section_names, dummy_data):
         assert v == dummy_data
 
 
+def test_items_with_legacy_section(fourc_input_with_legacy_section):
+    """Test if items are identical to the items of the sections."""
+    items = fourc_input_with_legacy_section.items()
+    assert len(items) == len(fourc_input_with_legacy_section.sections)
+    assert list(items) == list(fourc_input_with_legacy_section.sections.items())
+
+    # The items are a view and can be iterated multiple times
+    assert list(items) == list(items)
+
+
 def test_contains(fourc_input):
     """Test if section is contained."""
     assert fourc_input.get_section_names()[0] in fourc_input
@@ -340,6 +399,56 @@ def test_add(fourc_input, fourc_input_2, fourc_input_combined):
     assert added_input != fourc_input_2
 
 
+def test_copy(fourc_input_with_legacy_section):
+    """Test if the copy is independent of the original."""
+    copied_input = fourc_input_with_legacy_section.copy()
+    assert copied_input == fourc_input_with_legacy_section
+
+    copied_input["DNODE-NODE TOPOLOGY"][0]["d_id"] = 2
+    assert copied_input != fourc_input_with_legacy_section
+
+
+def test_convert_to_native_types(monkeypatch, section_names):
+    """Test if sections are only converted if necessary."""
+    monkeypatch.setattr(
+        FourCInput, "type_converter", Converter().register_numpy_types()
+    )
+    fourc_input = FourCInput({section_names[0]: {"a": np.float64(1.0)}})
+    assert type(fourc_input._sections[section_names[0]]["a"]) is float
+    assert fourc_input._converted
+
+    # Section is modifiable in place, hence the conversion is required
+    fourc_input[section_names[0]]["a"] = np.arange(2)
+    assert not fourc_input._converted
+
+    fourc_input.convert_to_native_types()
+    assert fourc_input._sections[section_names[0]]["a"] == [0, 1]
+    assert fourc_input._converted
+
+
+def test_convert_to_native_types_without_converters(section_names):
+    """Test if sections are not assumed to be converted without converters."""
+    fourc_input = FourCInput({section_names[0]: {"a": np.float64(1.0)}})
+    assert not fourc_input._converted
+
+    fourc_input.convert_to_native_types()
+    assert not fourc_input._converted
+
+
+def test_add_creates_independent_copy(monkeypatch, fourc_input, fourc_input_2):
+    """Test if the sum of two inputs does not share data with the inputs."""
+    monkeypatch.setattr(
+        FourCInput, "type_converter", Converter().register_numpy_types()
+    )
+    fourc_input_2_reference = fourc_input_2.copy()
+
+    combined_input = fourc_input + fourc_input_2
+    for section_name in fourc_input_2.get_section_names():
+        combined_input[section_name]["some"] = "other data"
+
+    assert fourc_input_2 == fourc_input_2_reference
+
+
 def test_equal(fourc_input):
     """Test for equal inputs."""
     assert fourc_input.sections == fourc_input.copy().sections
@@ -368,6 +477,34 @@ def test_load_includes(fourc_input, fourc_input_2, fourc_input_combined, tmp_pat
     assert fourc_input == fourc_input_combined
 
 
+def test_load_multiple_includes(
+    fourc_input, fourc_input_2, fourc_input_combined, section_names_2, tmp_path
+):
+    """Test loading multiple includes."""
+    include_paths = []
+    for section_name in section_names_2:
+        include_path = tmp_path / f"{section_name}.4C.yaml"
+        FourCInput({section_name: fourc_input_2[section_name]}).dump(include_path)
+        include_paths.append(str(include_path))
+
+    fourc_input["INCLUDES"] = include_paths
+
+    fourc_input.load_includes()
+
+    assert fourc_input == fourc_input_combined
+
+
+def test_load_includes_doubled_sections(fourc_input, tmp_path):
+    """Test loading includes with sections defined twice."""
+    path_to_other_sections = tmp_path / "split_data.4C.yaml"
+    fourc_input.dump(path_to_other_sections)
+
+    fourc_input["INCLUDES"] = [str(path_to_other_sections)]
+
+    with pytest.raises(ValueError, match="are defined in both"):
+        fourc_input.load_includes()
+
+
 def test_split(fourc_input, fourc_input_2, fourc_input_combined, section_names_2):
     """Test split."""
     first, second = fourc_input_combined.split(section_names_2)
@@ -95,6 +95,14 @@ def test_register_custom_type(converter):
     }
 
 
+def test_has_custom_converters(converter):
+    """Test if registered custom converters are detected."""
+    assert not converter.has_custom_converters()
+
+    converter.register_numpy_types()
+    assert converter.has_custom_converters()
+
+
 def test_not_convertible_type(converter):
     """Test conversion of a non-convertible type."""
 
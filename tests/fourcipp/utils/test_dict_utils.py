@@ -28,6 +28,7 @@ from fourcipp.utils.dict_utils import (
     _get_dict,
     change_default,
     compare_nested_dicts_or_lists,
+    copy_nested_dicts_or_lists,
     get_entry,
     make_default_explicit,
     make_default_implicit,
@@ -187,6 +188,23 @@ def test_compare_with_custom_function_failure():
         compare_nested_dicts_or_lists(obj, reference_obj, custom_compare=custom_compare)
 
 
+def test_copy_nested_dicts_or_lists():
+    """Test copying nested dicts and lists."""
+    data = {
+        "a": [1, 2.0, {"b": "c"}, [True, None]],
+        "d": {"e": np.array([1, 2])},
+    }
+    copied_data = copy_nested_dicts_or_lists(data)
+
+    assert copied_data["a"] == data["a"]
+    assert copied_data["a"] is not data["a"]
+    assert copied_data["a"][2] is not data["a"][2]
+    assert copied_data["a"][3] is not data["a"][3]
+    assert copied_data["d"] is not data["d"]
+    assert copied_data["d"]["e"] is not data["d"]["e"]
+    np.testing.assert_array_equal(copied_data["d"]["e"], data["d"]["e"])
+
+
 @pytest.fixture(name="nested_input_dict")
 def fixture_nested_input_dict():
     """Nested dict feature."""
@@ -21,7 +21,15 @@
 # THE SOFTWARE.
 """Test validation utils."""
 
-from fourcipp.utils.validation import find_keys_exceeding_max_value
+import pytest
+
+from fourcipp.utils.validation import (
+    ValidationError,
+    contains_reference,
+    find_keys_exceeding_max_value,
+    get_validator,
+    validate_using_json_schema,
+)
 
 
 def test_find_keys_exceeding_max_value():
@@ -38,3 +46,64 @@ def test_find_keys_exceeding_max_value():
         (["a"], large_val),
         (["b", "d", 2], large_val),
     ]
+
+
+def test_get_validator_is_cached():
+    """Test if the compiled validator is reused for the same schema."""
+    json_schema = {"type": "object", "required": ["a"]}
+    assert get_validator(json_schema) is get_validator(json_schema)
+    assert get_validator(json_schema, True) is get_validator(json_schema, True)
+    assert get_validator(json_schema) is not get_validator(json_schema, True)
+    assert get_validator(json_schema) is not get_validator(dict(json_schema))
+
+
+def test_validate_using_json_schema_ignore_required():
+    """Test if the required keys are ignored if desired."""
+    json_schema = {"type": "object", "required": ["a"]}
+    assert validate_using_json_schema({}, json_schema, ignore_required=True)
+    assert "required" in json_schema
+
+    with pytest.raises(ValidationError):
+        validate_using_json_schema({}, json_schema)
+
+
+def test_validate_using_json_schema_only_set_properties():
+    """Test if validation with only the set properties compiled is
+    identical."""
+    json_schema = {
+        "type": "object",
+        "properties": {"a": {"type": "integer"}, "b": {"type": "string"}},
+        "patternProperties": {"^c[0-9]$": {"type": "integer"}},
+        "additionalProperties": False,
+        "required": ["a"],
+    }
+    assert validate_using_json_schema({"a": 1, "c1": 1}, json_schema)
+
+    for data in [{"a": "1"}, {"a": 1, "c1": "1"}, {"a": 1, "d": 1}, {"b": "1"}]:
+        with pytest.raises(ValidationError):
+            validate_using_json_schema(data, json_schema)
+
+
+def test_validate_using_json_schema_with_reference():
+    """Test validation if properties reference other properties."""
+    json_schema = {
+        "type": "object",
+        "properties": {"a": {"type": "integer"}, "b": {"$ref": "#/properties/a"}},
+    }
+    assert validate_using_json_schema({"b": 1}, json_schema)
+
+    with pytest.raises(ValidationError):
+        validate_using_json_schema({"b": "1"}, json_schema)
+
+
+@pytest.mark.parametrize(
+    "obj, expected",
+    [
+        ({"a": [{"b": {"$ref": "#/c"}}]}, True),
+        ({"a": [{"b": {"$dynamicRef": "#c"}}]}, True),
+        ({"a": [{"b": {"ref": "#/c"}}], "c": "$ref"}, False),
+    ],
+)
+def test_contains_reference(obj, expected):
+    """Test if references are found in schemas."""
+    assert contains_reference(obj) == expected
@@ -124,3 +124,23 @@ def test_yaml_style(use_fourcipp_yaml_style, expected):
         dict_to_yaml_string(data, use_fourcipp_yaml_style=use_fourcipp_yaml_style)
         == expected
     )
+
+
+def test_load_yaml_floats_and_strings(tmp_path):
+    """Test if floats without leading or trailing digits and strings are
+    loaded correctly."""
+    yaml_file_path = tmp_path / "values.yaml"
+    yaml_file_path.write_text("a: .5\nb: -5.\nc: info\n", encoding="utf-8")
+    assert load_yaml(yaml_file_path) == {"a": 0.5, "b": -5.0, "c": "info"}
+
+
+def test_load_yaml_skip_sections(tmp_path):
+    """Test if sections are skipped."""
+    yaml_file_path = tmp_path / "sections.yaml"
+    yaml_file_path.write_text(
+        "a: 1\nb:\n  - 1 2 3\n  - 4 5 6\nc:\n  d: 2\n", encoding="utf-8"
+    )
+    assert load_yaml(yaml_file_path, skip_sections=["b", "d"]) == {
+        "a": 1,
+        "c": {"d": 2},
+    }